@@ -4,6 +4,21 @@ CREATE SCHEMA IF NOT EXISTS staging;
 -- Staging schema contains raw tables loaded via dbt seed
 -- Tables have no foreign keys to allow flexible data loading
 -- Deduplication is handled in dbt staging models
+-- scripts/simulate_claims_feed.py also runs this file to create load_batches, so keep it idempotent
+
+-- Load batch registry (one row per raw ingest, e.g. claims feed micro-batches)
+CREATE TABLE IF NOT EXISTS staging.load_batches (
+    load_id BIGSERIAL PRIMARY KEY,
+    source_name TEXT NOT NULL,
+    description TEXT,
+    file_pattern TEXT,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    completed_at TIMESTAMPTZ,
+    row_count INTEGER,
+    status TEXT NOT NULL DEFAULT 'started'
+);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_load_batches_file_pattern_completed
+ON staging.load_batches (file_pattern) WHERE status = 'completed';
 
 -- Plans raw
 CREATE TABLE IF NOT EXISTS staging.plans_raw (
@@ -126,7 +141,9 @@ CREATE TABLE IF NOT EXISTS staging.claims_raw (
     best_contracting_entity_name TEXT,
     provider_group_name TEXT,
     ccsr_system_description TEXT,
-    ccsr_description TEXT
+    ccsr_description TEXT,
+    load_id BIGINT,
+    load_timestamp TIMESTAMPTZ
 );
 
 -- Indexes
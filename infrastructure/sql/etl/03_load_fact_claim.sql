@@ -0,0 +1,40 @@
+-- Load dw.fact_claim (idempotent: ON CONFLICT on the natural key PK)
+-- scripts/run_sql_etl.py runs this insert once per service month in parallel by
+-- replacing the slice predicate in its WHERE clause with a month range.
+
+INSERT INTO dw.fact_claim (
+    claim_id, member_sk, provider_sk, plan_sk, date_key, service_date,
+    claim_amount, allowed_amount, paid_amount, status,
+    diagnosis_code, procedure_code, load_id
+)
+SELECT
+    c.claim_id,
+    dm.member_sk,
+    dp.provider_sk,
+    pl.plan_sk,
+    (
+        EXTRACT(YEAR FROM c.service_date)::int * 10000
+        + EXTRACT(MONTH FROM c.service_date)::int * 100
+        + EXTRACT(DAY FROM c.service_date)::int
+    ) AS date_key,
+    c.service_date,
+    c.claim_amount,
+    c.allowed_amount,
+    c.paid_amount,
+    c.status,
+    c.diagnosis_code,
+    c.procedure_code,
+    c.load_id
+FROM staging.claims_raw AS c
+INNER JOIN dw.dim_member AS dm ON c.member_id = dm.member_id AND dm.current_flag
+INNER JOIN
+    dw.dim_provider AS dp
+    ON c.provider_id = dp.provider_id AND dp.current_flag
+INNER JOIN
+    dw.dim_plan AS pl
+    ON
+        c.plan_id = pl.plan_id
+        AND pl.effective_year = EXTRACT(YEAR FROM c.service_date)
+        AND pl.current_flag
+WHERE /* slice */ TRUE
+ON CONFLICT (claim_id) DO NOTHING;
@@ -0,0 +1,38 @@
+-- Load dw.fact_enrollment (idempotent: ON CONFLICT on the natural key PK)
+-- scripts/run_sql_etl.py runs this insert once per start month in parallel by
+-- replacing the slice predicate in its WHERE clause with a month range.
+
+INSERT INTO dw.fact_enrollment (
+    enrollment_id, member_sk, plan_sk, start_date_key, end_date_key,
+    start_date, end_date, premium_paid, csr_variant, coverage_days, load_id
+)
+SELECT
+    e.enrollment_id,
+    dm.member_sk,
+    pl.plan_sk,
+    (
+        EXTRACT(YEAR FROM e.start_date)::int * 10000
+        + EXTRACT(MONTH FROM e.start_date)::int * 100
+        + EXTRACT(DAY FROM e.start_date)::int
+    ) AS start_date_key,
+    (
+        EXTRACT(YEAR FROM e.end_date)::int * 10000
+        + EXTRACT(MONTH FROM e.end_date)::int * 100
+        + EXTRACT(DAY FROM e.end_date)::int
+    ) AS end_date_key,
+    e.start_date,
+    e.end_date,
+    e.premium_paid,
+    e.csr_variant,
+    (e.end_date - e.start_date + 1)::int AS coverage_days,
+    e.load_id
+FROM staging.enrollments_raw AS e
+INNER JOIN dw.dim_member AS dm ON e.member_id = dm.member_id AND dm.current_flag
+INNER JOIN
+    dw.dim_plan AS pl
+    ON
+        e.plan_id = pl.plan_id
+        AND pl.effective_year = EXTRACT(YEAR FROM e.start_date)
+        AND pl.current_flag
+WHERE /* slice */ TRUE
+ON CONFLICT (enrollment_id) DO NOTHING;
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark HyperLogLog roll-ups against exact count(distinct) on the facts.
+
+The cubes store a unique_members_hll sketch per cell (transform/macros/hll.sql).
+For each roll-up below the sketch merge (hll_rollup over the cube) is timed
+against the exact count(distinct member_id) over fct_claim / dim_member and
+the relative error of every merged group is reported. A second pass sketches
+1..n synthetic ids to show the error once the cardinality is past the
+linear-counting range.
+
+SQL is compiled from the dbt macros (dbt compile --inline), so the cubes must
+already be built: cd transform && dbt build
+
+Run from the repo root: python scripts/benchmark_hll_rollups.py
+"""
+import os
+import statistics
+import subprocess
+import time
+from typing import Dict, List, Tuple
+
+import psycopg
+
+# User-configurable parameters
+DBT_PROJECT_DIR = "transform"
+DBT_TARGET = os.environ.get("DBT_TARGET", "dev")
+PG_DSN = (
+    f"host={os.environ.get('PGHOST', 'localhost')} "
+    f"user={os.environ.get('PGUSER', 'etl')} "
+    f"password={os.environ.get('PGPASSWORD', 'etl')} "
+    "port=5432 dbname=aca_health"
+)
+REPEATS = 5
+SYNTHETIC_CARDINALITIES = [1_000, 10_000, 100_000, 1_000_000]
+
+# The normalizer carries only profile_id; member attributes come from dim_member_profile
+NORMALIZER_BY_PROFILE = (
+    "(select n.year, p.state, p.plan_metal, n.unique_members_hll "
+    "from {{ ref('agg_trend_normalizer') }} n "
+    "join {{ ref('dim_member_profile') }} p on p.profile_id = n.profile_id)"
+)
+
+# Each roll-up merges a cube's sketches and checks them against an exact query
+ROLLUPS: List[Dict[str, object]] = [
+    {
+        "name": "normalizer -> year x state",
+        "cube": NORMALIZER_BY_PROFILE,
+        "group_by": ["year", "state"],
+        "exact_sql": "select year, state, count(distinct member_id) from dw.dim_member "
+                     "where year in (2024, 2025) group by year, state",
+    },
+    {
+        "name": "normalizer -> year x plan_metal",
+        "cube": NORMALIZER_BY_PROFILE,
+        "group_by": ["year", "plan_metal"],
+        "exact_sql": "select year, plan_metal, count(distinct member_id) from dw.dim_member "
+                     "where year in (2024, 2025) group by year, plan_metal",
+    },
+    {
+        "name": "provider_performance -> state",
+        "cube": "{{ ref('agg_provider_performance') }}",
+        "group_by": ["state"],
+        "exact_sql": "select p.state, count(distinct c.member_id) from dw.fct_claim c "
+                     "left join dw.dim_provider p on c.provider_id = p.provider_id "
+                     "where c.claim_date >= '2025-01-01' group by p.state",
+    },
+    {
+        "name": "plan_performance_cube -> plan (all months)",
+        "cube": "{{ ref('agg_plan_performance_cube') }}",
+        "group_by": ["plan_id"],
+        "exact_sql": "select plan_id, count(distinct member_id) from dw.fct_claim "
+                     "where claim_date >= '2025-01-01' group by plan_id",
+    },
+    {
+        "name": "provider_specialty_monthly_cube -> specialty",
+        "cube": "{{ ref('agg_provider_specialty_monthly_cube') }}",
+        "group_by": ["specialty"],
+        "exact_sql": "select p.specialty, count(distinct c.member_id) from dw.fct_claim c "
+                     "join dw.dim_provider p on c.provider_id = p.provider_id "
+                     "where c.claim_date >= '2025-01-01' group by p.specialty",
+    },
+]
+
+
+def compile_inline(jinja_sql: str) -> str:
+    """Render macros through dbt so the benchmark runs exactly what the cubes use."""
+    result = subprocess.run(
+        ["dbt", "--quiet", "compile", "--target", DBT_TARGET, "--inline", jinja_sql],
+        cwd=DBT_PROJECT_DIR, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip()
+
+
+def timed(conn: psycopg.Connection, sql: str) -> Tuple[List[tuple], float]:
+    """Best-of-REPEATS wall time; returns the rows of the last run."""
+    best = float("inf")
+    rows: List[tuple] = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        rows = conn.execute(sql).fetchall()
+        best = min(best, time.perf_counter() - started)
+    return rows, best
+
+
+def relative_errors(estimates: Dict[tuple, float], exact: Dict[tuple, int]) -> List[float]:
+    return [abs(float(estimates.get(k, 0)) - v) / v for k, v in exact.items() if v > 0]
+
+
+def main() -> None:
+    """Time sketch merges vs exact distinct counts and report error."""
+    with psycopg.connect(PG_DSN) as conn:
+        print(f"{'roll-up':46} {'groups':>6} {'exact ms':>9} {'hll ms':>8} {'mean err':>9} {'max err':>8}")
+        for r in ROLLUPS:
+            n_keys = len(r["group_by"])
+            rollup_sql = compile_inline(
+                f"{{% set cube %}}{r['cube']}{{% endset %}}{{{{ hll_rollup(cube, {r['group_by']!r}) }}}}"
+            )
+            select_sql = f"select {', '.join(r['group_by'])}, unique_members_estimate from ({rollup_sql}) as rollup"
+
+            exact_rows, exact_s = timed(conn, r["exact_sql"])
+            hll_rows, hll_s = timed(conn, select_sql)
+            exact = {tuple(row[:n_keys]): row[n_keys] for row in exact_rows}
+            estimates = {tuple(row[:n_keys]): row[n_keys] for row in hll_rows}
+            errs = relative_errors(estimates, exact)
+            print(
+                f"{r['name']:46} {len(exact):>6} {exact_s * 1000:>9.1f} {hll_s * 1000:>8.1f} "
+                f"{statistics.mean(errs):>8.2%} {max(errs):>8.2%}"
+            )
+
+        print(f"\n{'synthetic distinct ids':>22} {'estimate':>12} {'rel err':>8}")
+        for n in SYNTHETIC_CARDINALITIES:
+            sql = compile_inline(
+                "select {{ hll_estimate('s') }} from ("
+                f"select {{{{ hll_sketch('g') }}}} as s from generate_series(1, {n}) as t(g)"
+                ") as sketch"
+            )
+            estimate = float(conn.execute(sql).fetchone()[0])
+            print(f"{n:>22,} {estimate:>12,.0f} {abs(estimate - n) / n:>8.2%}")
+
+    print("\n✅ HLL benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
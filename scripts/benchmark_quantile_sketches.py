@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark quantile-sketch roll-ups against exact percentile_cont on the facts.
+
+agg_provider_performance, agg_plan_performance_cube and agg_member_cost_cube
+store paid_amount_sketch / allowed_amount_sketch per cell
+(transform/macros/quantile_sketch.sql). For each roll-up below the sketch
+merge (quantile_rollup over the cube) is timed against percentile_cont over
+fct_claim, and the relative error of every merged group and quantile is
+reported. A second pass sketches 1..n synthetic values to show that the
+sketch size is bounded by the value range, not the row count.
+
+SQL is compiled from the dbt macros (dbt compile --inline), so the cubes must
+already be built: cd transform && dbt build
+
+Run from the repo root: python scripts/benchmark_quantile_sketches.py
+"""
+import os
+import statistics
+import subprocess
+import time
+from typing import Dict, List, Tuple
+
+import psycopg
+
+# User-configurable parameters
+DBT_PROJECT_DIR = "transform"
+DBT_TARGET = os.environ.get("DBT_TARGET", "dev")
+PG_DSN = (
+    f"host={os.environ.get('PGHOST', 'localhost')} "
+    f"user={os.environ.get('PGUSER', 'etl')} "
+    f"password={os.environ.get('PGPASSWORD', 'etl')} "
+    "port=5432 dbname=aca_health"
+)
+REPEATS = 5
+QUANTILES = [0.5, 0.9, 0.95, 0.99]
+SYNTHETIC_ROW_COUNTS = [1_000, 10_000, 100_000, 1_000_000]
+
+# Exact percentiles come from the same 2025+ claims the cubes aggregate
+CLAIMS_2025 = "from dw.fct_claim c {join} where c.claim_date >= '2025-01-01'"
+
+# Each roll-up merges a cube's sketches and checks them against an exact query
+ROLLUPS: List[Dict[str, object]] = [
+    {
+        "name": "provider_performance -> specialty (paid)",
+        "cube": "{{ ref('agg_provider_performance') }}",
+        "group_by": ["specialty"],
+        "sketch": "paid_amount_sketch",
+        "exact_from": CLAIMS_2025.format(
+            join="left join dw.dim_provider p on c.provider_id = p.provider_id and p.is_current"
+        ),
+        "exact_group_by": ["p.specialty"],
+        "value": "c.paid_amount",
+    },
+    {
+        "name": "provider_performance -> all claims (allowed)",
+        "cube": "{{ ref('agg_provider_performance') }}",
+        "group_by": [],
+        "sketch": "allowed_amount_sketch",
+        "exact_from": CLAIMS_2025.format(join=""),
+        "exact_group_by": [],
+        "value": "c.allowed_amount",
+    },
+    {
+        "name": "plan_performance_cube -> plan (paid)",
+        "cube": "{{ ref('agg_plan_performance_cube') }}",
+        "group_by": ["plan_id"],
+        "sketch": "paid_amount_sketch",
+        "exact_from": CLAIMS_2025.format(join="join dw.dim_plan p on c.plan_id = p.plan_id"),
+        "exact_group_by": ["p.plan_id"],
+        "value": "c.paid_amount",
+    },
+    {
+        "name": "plan_performance_cube -> month (allowed)",
+        "cube": "{{ ref('agg_plan_performance_cube') }}",
+        "group_by": ["report_month"],
+        "sketch": "allowed_amount_sketch",
+        "exact_from": CLAIMS_2025.format(join="join dw.dim_plan p on c.plan_id = p.plan_id"),
+        "exact_group_by": ["date_trunc('month', c.claim_date)"],
+        "value": "c.allowed_amount",
+    },
+    # the member cube carries member attributes per row, so it rolls up by them directly
+    {
+        "name": "member_cost_cube -> region x metal (paid)",
+        "cube": "{{ ref('agg_member_cost_cube') }}",
+        "group_by": ["region", "plan_metal"],
+        "sketch": "paid_amount_sketch",
+        "exact_from": CLAIMS_2025.format(
+            join="join dw.dim_member m on c.member_id = m.member_id and m.is_current"
+        ),
+        "exact_group_by": ["m.region", "m.plan_metal"],
+        "value": "c.paid_amount",
+    },
+]
+
+
+def compile_inline(jinja_sql: str) -> str:
+    """Render macros through dbt so the benchmark runs exactly what the cubes use."""
+    result = subprocess.run(
+        ["dbt", "--quiet", "compile", "--target", DBT_TARGET, "--inline", jinja_sql],
+        cwd=DBT_PROJECT_DIR, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip()
+
+
+def timed(conn: psycopg.Connection, sql: str) -> Tuple[List[tuple], float]:
+    """Best-of-REPEATS wall time; returns the rows of the last run."""
+    best = float("inf")
+    rows: List[tuple] = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        rows = conn.execute(sql).fetchall()
+        best = min(best, time.perf_counter() - started)
+    return rows, best
+
+
+def exact_sql(r: Dict[str, object]) -> str:
+    keys = r["exact_group_by"]
+    percentiles = ", ".join(f"percentile_cont({q}) within group (order by {r['value']})" for q in QUANTILES)
+    group_by = f" group by {', '.join(keys)}" if keys else ""
+    return f"select {''.join(k + ', ' for k in keys)}{percentiles} {r['exact_from']}{group_by}"
+
+
+def relative_errors(estimates: Dict[tuple, tuple], exact: Dict[tuple, tuple]) -> List[float]:
+    """One error per group and quantile; a zero exact value must be estimated as exactly zero."""
+    errs = []
+    for k, values in exact.items():
+        for e, x in zip(estimates.get(k, (None,) * len(values)), values):
+            e, x = float(e if e is not None else 0), float(x)
+            errs.append(abs(e - x) / x if x else float(e != x))
+    return errs
+
+
+def main() -> None:
+    """Time sketch merges vs percentile_cont and report error."""
+    with psycopg.connect(PG_DSN) as conn:
+        print(f"quantiles: {', '.join(f'p{q * 100:g}' for q in QUANTILES)}")
+        print(f"{'roll-up':46} {'groups':>6} {'exact ms':>9} {'sketch ms':>9} {'mean err':>9} {'max err':>8}")
+        for r in ROLLUPS:
+            n_keys = len(r["group_by"])
+            prefix = r["sketch"].replace("_sketch", "")
+            rollup_sql = compile_inline(
+                f"{{% set cube %}}{r['cube']}{{% endset %}}"
+                f"{{{{ quantile_rollup(cube, {r['group_by']!r}, {r['sketch']!r}, {QUANTILES!r}) }}}}"
+            )
+            columns = [*r["group_by"], *(f"{prefix}_p{q * 100:g}".replace(".", "_") for q in QUANTILES)]
+            select_sql = f"select {', '.join(columns)} from ({rollup_sql}) as rollup"
+
+            exact_rows, exact_s = timed(conn, exact_sql(r))
+            sketch_rows, sketch_s = timed(conn, select_sql)
+            exact = {tuple(row[:n_keys]): row[n_keys:] for row in exact_rows}
+            estimates = {tuple(row[:n_keys]): row[n_keys:] for row in sketch_rows}
+            errs = relative_errors(estimates, exact)
+            print(
+                f"{r['name']:46} {len(exact):>6} {exact_s * 1000:>9.1f} {sketch_s * 1000:>9.1f} "
+                f"{statistics.mean(errs):>8.2%} {max(errs):>8.2%}"
+            )
+
+        print(f"\n{'synthetic values':>16} {'buckets':>8} {'p50 err':>8} {'p99 err':>8}")
+        for n in SYNTHETIC_ROW_COUNTS:
+            # log-uniform values between $1 and ~$22k, every row distinct
+            values = f"(select exp(((cast(g as bigint) * 7919) % {n}) * 10.0 / {n}) as v from generate_series(1, {n}) as t(g))"
+            sql = compile_inline(
+                f"{{% set values %}}{values}{{% endset %}}"
+                "select cardinality(s), {{ quantile_estimate('s', 0.5) }}, {{ quantile_estimate('s', 0.99) }} "
+                "from ({{ quantile_sketch(values, [], 'v', 's') }}) as sketch"
+            )
+            buckets, p50, p99 = conn.execute(sql).fetchone()
+            exact_p50, exact_p99 = conn.execute(
+                f"select percentile_cont(0.5) within group (order by v), "
+                f"percentile_cont(0.99) within group (order by v) from {values} as x"
+            ).fetchone()
+            print(
+                f"{n:>16,} {buckets:>8} {abs(p50 - exact_p50) / exact_p50:>8.2%} "
+                f"{abs(p99 - exact_p99) / exact_p99:>8.2%}"
+            )
+
+    print("\n✅ Quantile sketch benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Compare summary cube outputs between the Postgres and DuckDB dbt targets.
+
+Both targets must already be built from the same seed files:
+  cd transform
+  dbt build                                   # Postgres (dev target)
+  dbt seed --target duckdb && dbt build --target duckdb
+
+For every cube the row count and the sum of each numeric column are compared
+within a relative tolerance (float vs numeric rounding differs slightly).
+
+Run from the repo root: python scripts/compare_duckdb_parity.py
+Exits non-zero if any cube differs.
+"""
+import math
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import duckdb
+import psycopg
+
+# User-configurable parameters
+DUCKDB_PATH = os.environ.get("DUCKDB_PATH", "transform/target/aca_health.duckdb")
+PG_DSN = (
+    f"host={os.environ.get('PGHOST', 'localhost')} "
+    f"user={os.environ.get('PGUSER', 'etl')} "
+    f"password={os.environ.get('PGPASSWORD', 'etl')} "
+    "port=5432 dbname=aca_health"
+)
+REL_TOLERANCE = 1e-6
+
+# (schema, table) pairs to compare
+CUBES: List[Tuple[str, str]] = [
+    ("summary", "agg_claims_monthly"),
+    ("summary", "agg_claims_diagnosis_summary_cube"),
+    ("summary", "agg_member_cost_cube"),
+    ("summary", "agg_member_risk_stratification_cube"),
+    ("summary", "agg_plan_performance_cube"),
+    ("summary", "agg_provider_performance"),
+    ("summary", "agg_provider_specialty_monthly_cube"),
+    ("dw", "agg_trend_descriptor"),
+    ("dw", "agg_trend_normalizer"),
+]
+
+NUMERIC_TYPES = {"TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "FLOAT", "DOUBLE"}
+
+
+def numeric_columns(con: duckdb.DuckDBPyConnection, schema: str, table: str) -> List[str]:
+    rows = con.execute(
+        "select column_name, data_type from information_schema.columns "
+        "where table_schema = ? and table_name = ? order by ordinal_position",
+        [schema, table],
+    ).fetchall()
+    return [name for name, dtype in rows if dtype in NUMERIC_TYPES or dtype.startswith("DECIMAL")]
+
+
+def profile_sql(schema: str, table: str, columns: List[str]) -> str:
+    sums = "".join(f", sum({c})::float" for c in columns)
+    return f"select count(*){sums} from {schema}.{table}"
+
+
+def close_enough(a: Optional[float], b: Optional[float]) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return math.isclose(float(a), float(b), rel_tol=REL_TOLERANCE, abs_tol=REL_TOLERANCE)
+
+
+def main() -> None:
+    """Profile each cube on both targets and report any differences."""
+    duck = duckdb.connect(DUCKDB_PATH, read_only=True)
+    mismatches: Dict[str, List[str]] = {}
+
+    with psycopg.connect(PG_DSN) as pg:
+        for schema, table in CUBES:
+            columns = numeric_columns(duck, schema, table)
+            sql = profile_sql(schema, table, columns)
+            duck_row = duck.execute(sql).fetchone()
+            pg_row = pg.execute(sql).fetchone()
+
+            labels = ["row_count"] + [f"sum({c})" for c in columns]
+            diffs = [
+                f"{label}: postgres={p} duckdb={d}"
+                for label, p, d in zip(labels, pg_row, duck_row)
+                if not close_enough(p, d)
+            ]
+            status = "OK" if not diffs else "MISMATCH"
+            print(f"{status:8} {schema}.{table} ({duck_row[0]} rows, {len(columns)} numeric cols)")
+            if diffs:
+                mismatches[f"{schema}.{table}"] = diffs
+
+    for name, diffs in mismatches.items():
+        print(f"\n{name}")
+        for d in diffs:
+            print(f"  - {d}")
+
+    if mismatches:
+        sys.exit(1)
+    print("\n✅ DuckDB and Postgres cube outputs match")
+
+
+if __name__ == "__main__":
+    main()
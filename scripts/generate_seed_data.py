@@ -5,16 +5,27 @@ Generate ACA-like synthetic seed data as CSVs using Faker.
 Outputs:
   - Timestamped files in data/seeds/ (for archival/versioning)
   - Stable-named files in transform/seeds/ (for dbt seed)
+
+Subsample mode (SUBSAMPLE_FRACTION > 0) keeps a deterministic hash-based
+fraction of members with all of their enrollments and claims, plus only the
+plans and providers those rows reference. It applies to freshly generated
+data, or to existing seed CSVs when SUBSAMPLE_SOURCE_DIR is set (a directory
+holding members.csv, enrollments.csv, claims.csv, plans.csv and providers.csv,
+streamed in one pass per file):
+  cp -r transform/seeds data/full_seeds
+  SUBSAMPLE_FRACTION=0.01 SUBSAMPLE_SOURCE_DIR=data/full_seeds python scripts/generate_seed_data.py
   
 Run without CLI args: python scripts/generate_seed_data.py
 """
 import csv
+import hashlib
 import json
 import os
 import random
 import shutil
+from contextlib import ExitStack
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from faker import Faker
 
@@ -28,6 +39,11 @@ CLAIMS_PER_YEAR = 50000  # real dist 10,000,000 per year
 
 SEED = 1
 
+# Subsample mode: 0 writes the full dataset; 0.01 keeps ~1% of members
+SUBSAMPLE_FRACTION = float(os.environ.get("SUBSAMPLE_FRACTION", "0"))
+SUBSAMPLE_SOURCE_DIR = os.environ.get("SUBSAMPLE_SOURCE_DIR")  # subsample these seed CSVs instead of generating
+SUBSAMPLE_SALT = "aca_health"  # change to draw a different (still deterministic) sample
+
 METAL_TIERS = ["Bronze", "Silver", "Gold", "Platinum"]
 PROVIDER_SPECIALTIES = [
     "Family Medicine",
@@ -60,6 +76,12 @@ CENSUS_REGIONS = {
 }
 STATE_TO_REGION = {st: region for region, states in CENSUS_REGIONS.items() for st in states}
 
+# Claim utilization: members are drawn in proportion to risk-adjusted exposure (ra_mm)
+# times a segment/high-cost boost, times a lognormal propensity for a heavy tail
+SEGMENT_UTILIZATION = {"Healthy": 0.6, "Maternity": 1.5, "Behavioral": 1.5, "Chronic": 2.0, "Complex": 3.0}
+HIGH_COST_UTILIZATION = 4.0
+UTILIZATION_SIGMA = 1.0  # lognormal shape; larger = heavier tail
+
 CLAIM_STATUS = ["approved", "denied", "pending"]
 # Replaced ICD-10 with ICD-11 sample codes
 ICD11_SAMPLE = [
@@ -153,6 +175,67 @@ def write_csv(path: str, rows: List[Dict[str, object]], fieldnames: List[str]) -
             w.writerow(r)
 
 
+def keep_member(member_id: str, fraction: float) -> bool:
+    """Hash-based member sample: the same ids are kept on every run and at every scale."""
+    digest = hashlib.blake2b(f"{SUBSAMPLE_SALT}:{member_id}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") < fraction * 2**64
+
+
+def write_subsample(entities: List[Dict[str, object]], out_dir: str, fraction: float) -> None:
+    """Stream each entity once, keeping sampled members and the plans/providers they reference.
+
+    Member-keyed entities are written first so that plans and providers can be
+    filtered against the referenced ids; memory is bounded by those id sets, not
+    by row counts. Output goes to temp files swapped in at the end, so out_dir
+    may be the source directory.
+    """
+    by_name = {e["name"]: e for e in entities}
+    plan_ids: Set[str] = set()
+    provider_ids: Set[str] = set()
+    keep_rules = {
+        "members": lambda r: keep_member(r["member_id"], fraction),
+        "enrollments": lambda r: keep_member(r["member_id"], fraction),
+        "claims": lambda r: keep_member(r["member_id"], fraction),
+        "plans": lambda r: r["plan_id"] in plan_ids,
+        "providers": lambda r: r["provider_id"] in provider_ids,
+    }
+
+    written: List[str] = []
+    for name, keep in keep_rules.items():
+        entity = by_name[name]
+        tmp_path = os.path.join(out_dir, f"{name}.csv.tmp")
+        kept = seen = 0
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=entity["fields"])
+            w.writeheader()
+            for r in entity["data"]:
+                seen += 1
+                if not keep(r):
+                    continue
+                if name in ("enrollments", "claims"):
+                    plan_ids.add(r["plan_id"])
+                if name == "claims":
+                    provider_ids.add(r["provider_id"])
+                w.writerow(r)
+                kept += 1
+        written.append(name)
+        print(f"  - Kept {kept:,} of {seen:,} {name} ({kept / seen if seen else 0:.2%})")
+
+    for name in written:
+        os.replace(os.path.join(out_dir, f"{name}.csv.tmp"), os.path.join(out_dir, f"{name}.csv"))
+
+
+def subsample_seed_files(src_dir: str, out_dir: str, fraction: float) -> None:
+    """Subsample existing seed CSVs (any scale) into out_dir without loading them into memory."""
+    with ExitStack() as stack:
+        entities: List[Dict[str, object]] = []
+        for name in ["members", "enrollments", "claims", "plans", "providers"]:
+            f = stack.enter_context(open(os.path.join(src_dir, f"{name}.csv"), newline="", encoding="utf-8"))
+            reader = csv.DictReader(f)
+            entities.append({"name": name, "data": reader, "fields": reader.fieldnames})
+        write_subsample(entities, out_dir, fraction)
+
+
 def gen_plans(fake: Faker, n: int, year: int) -> List[Dict[str, object]]:
     plans: List[Dict[str, object]] = []
     for i in range(1, n + 1):
@@ -399,6 +482,38 @@ def pick_active_enrollment(
     return None
 
 
+def member_utilization_weight(m: Dict[str, object]) -> float:
+    """Relative claim propensity from the risk factors gen_members computed."""
+    weight = float(m["ra_mm"]) * SEGMENT_UTILIZATION.get(m["clinical_segment"], 1.0)
+    if m["high_cost_member"]:
+        weight *= HIGH_COST_UTILIZATION
+    return weight
+
+
+def build_alias_table(weights: List[float]) -> Tuple[List[float], List[int]]:
+    """Vose alias table: O(n) to build, O(1) per weighted draw (see alias_draw)."""
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        small_i, large_i = small.pop(), large.pop()
+        prob[small_i] = scaled[small_i]
+        alias[small_i] = large_i
+        scaled[large_i] -= 1.0 - scaled[small_i]
+        (small if scaled[large_i] < 1.0 else large).append(large_i)
+    # leftovers are 1.0 up to float rounding
+    return prob, alias
+
+
+def alias_draw(prob: List[float], alias: List[int]) -> int:
+    i = random.randrange(len(prob))
+    return i if random.random() < prob[i] else alias[i]
+
+
 def gen_claims(
     fake: Faker,
     members: List[Dict[str, object]],
@@ -435,9 +550,15 @@ def gen_claims(
     for cat in categories:
         weights.append(weights_map.get(cat, 0.05))
     
+    # Per-member utilization weights, sampled through an alias table (O(1) per claim)
+    member_weights = [
+        member_utilization_weight(m) * random.lognormvariate(0.0, UTILIZATION_SIGMA) for m in members
+    ]
+    alias_prob, alias_idx = build_alias_table(member_weights)
+
     claims: List[Dict[str, object]] = []
     for i in range(1, n_claims + 1):
-        m = random.choice(members)
+        m = members[alias_draw(alias_prob, alias_idx)]
         service_dt = date(year, 1, 1) + timedelta(days=random.randint(0, 364))
         enr = pick_active_enrollment(enrollments_by_member.get(m["member_id"], []), service_dt)
         if not enr:
@@ -605,6 +726,11 @@ def gen_claims(
 
 def main() -> None:
     """Generate synthetic ACA data and write to dbt directories."""
+    if not 0 <= SUBSAMPLE_FRACTION <= 1:
+        raise ValueError(f"SUBSAMPLE_FRACTION must be in [0, 1] (0 = full dataset), got {SUBSAMPLE_FRACTION}")
+    if SUBSAMPLE_SOURCE_DIR and SUBSAMPLE_FRACTION == 0:
+        raise ValueError("SUBSAMPLE_SOURCE_DIR needs SUBSAMPLE_FRACTION in (0, 1]")
+
     # Use config variables
     dbt_out = DBT_SEEDS_DIR
     years = YEARS
@@ -614,6 +740,13 @@ def main() -> None:
     claims_per_year = CLAIMS_PER_YEAR
     seed = SEED
 
+    if SUBSAMPLE_SOURCE_DIR:
+        ensure_dir(dbt_out)
+        print(f"Subsampling {SUBSAMPLE_FRACTION:.2%} of members from {SUBSAMPLE_SOURCE_DIR}...")
+        subsample_seed_files(SUBSAMPLE_SOURCE_DIR, dbt_out, SUBSAMPLE_FRACTION)
+        print(f"\n✅ Wrote subsampled CSVs to: {dbt_out}")
+        return
+
     random.seed(seed)
     fake = Faker("en_US")
     fake.seed_instance(seed)
@@ -787,6 +920,13 @@ def main() -> None:
         },
     ]
 
+    if SUBSAMPLE_FRACTION:
+        # Generate at full scale, then keep a member sample so distributions and ids match
+        print(f"\nSubsampling {SUBSAMPLE_FRACTION:.2%} of members...")
+        write_subsample(entities, dbt_out, SUBSAMPLE_FRACTION)
+        print(f"\n✅ Wrote subsampled CSVs to: {dbt_out}")
+        return
+
     # Write files to both directories
     for entity in entities:
         # Stable-named file for dbt
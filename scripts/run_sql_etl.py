@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Run the legacy SQL ETL (infrastructure/sql/etl) as a dependency graph.
+
+Steps:
+  - dim_date        : 01_load_dim_date.sql
+  - dimensions      : 02_load_dimensions.sql          (after dim_date)
+  - fact_claim      : 03_load_fact_claim.sql, one slice per service month      (after dimensions)
+  - fact_enrollment : 04_load_fact_enrollment.sql, one slice per start month (after dimensions)
+
+Every step whose dependencies are done runs at once, and fact slices run
+concurrently over a psycopg connection pool. Each fact file is a single
+INSERT ... ON CONFLICT DO NOTHING whose `/* slice */ TRUE` predicate is
+replaced by a month range (plus one slice for rows with a null date), so each
+slice is atomic (autocommit) and a failed slice is retried on its own without
+touching the others.
+
+Run without CLI args: python scripts/run_sql_etl.py
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Dict, List, Optional
+
+from psycopg_pool import ConnectionPool
+
+# User-configurable parameters
+ETL_DIR = "infrastructure/sql/etl/"
+PG_DSN = (
+    f"host={os.environ.get('PGHOST', 'localhost')} "
+    f"user={os.environ.get('PGUSER', 'etl')} "
+    f"password={os.environ.get('PGPASSWORD', 'etl')} "
+    "port=5432 dbname=aca_health"
+)
+WORKERS = os.cpu_count() or 4
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 2.0
+
+# Sliced SQL files mark where the month predicate goes; run as-is they load everything
+SLICE_PLACEHOLDER = "/* slice */ TRUE"
+
+# Month slices are discovered from the staging data for each fact step; null dates get their own slice
+SLICE_MONTHS_SQL = {
+    "claims_raw": (
+        "SELECT DISTINCT date_trunc('month', service_date)::date FROM staging.claims_raw "
+        "WHERE service_date IS NOT NULL ORDER BY 1"
+    ),
+    "enrollments_raw": (
+        "SELECT DISTINCT date_trunc('month', start_date)::date FROM staging.enrollments_raw "
+        "WHERE start_date IS NOT NULL ORDER BY 1"
+    ),
+}
+
+STEPS: List[Dict[str, object]] = [
+    {"name": "dim_date", "depends_on": [], "sql_file": "01_load_dim_date.sql"},
+    {"name": "dimensions", "depends_on": ["dim_date"], "sql_file": "02_load_dimensions.sql"},
+    {
+        "name": "fact_claim", "depends_on": ["dimensions"], "sql_file": "03_load_fact_claim.sql",
+        "slice_column": "c.service_date", "slice_source": "claims_raw",
+    },
+    {
+        "name": "fact_enrollment", "depends_on": ["dimensions"], "sql_file": "04_load_fact_enrollment.sql",
+        "slice_column": "e.start_date", "slice_source": "enrollments_raw",
+    },
+]
+
+
+def next_month(d: date) -> date:
+    return date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
+
+
+def build_tasks(pool: ConnectionPool, step: Dict[str, object]) -> List[Dict[str, object]]:
+    """Expand a step into runnable tasks: its SQL file once, or once per month slice."""
+    with open(os.path.join(ETL_DIR, step["sql_file"]), "r") as f:
+        sql = f.read()
+    if "slice_column" not in step:
+        return [{"label": step["name"], "sql": sql, "params": None}]
+
+    if sql.count(SLICE_PLACEHOLDER) != 1:
+        raise ValueError(f"{step['sql_file']}: expected exactly one '{SLICE_PLACEHOLDER}' predicate")
+    column = step["slice_column"]
+    month_sql = sql.replace(SLICE_PLACEHOLDER, f"{column} >= %(slice_start)s AND {column} < %(slice_end)s")
+    with pool.connection() as conn:
+        months = [row[0] for row in conn.execute(SLICE_MONTHS_SQL[step["slice_source"]])]
+    tasks = [
+        {
+            "label": f"{step['name']}[{m:%Y-%m}]",
+            "sql": month_sql,
+            "params": {"slice_start": m, "slice_end": next_month(m)},
+        }
+        for m in months
+    ]
+    # rows without a date fall outside every month; give them a slice so the load still covers them
+    null_sql = sql.replace(SLICE_PLACEHOLDER, f"{column} IS NULL")
+    tasks.append({"label": f"{step['name']}[null]", "sql": null_sql, "params": {}})
+    return tasks
+
+
+def run_task(pool: ConnectionPool, task: Dict[str, object]) -> Dict[str, object]:
+    """Run one task, retrying only this task on failure."""
+    last_error: Optional[Exception] = None
+    for attempt in range(1, MAX_RETRIES + 1):
+        started = time.perf_counter()
+        try:
+            with pool.connection() as conn:
+                cur = conn.execute(task["sql"], task["params"])
+                # a whole SQL file's rowcount is its last statement's; only slices report real row counts
+                rows = max(cur.rowcount, 0) if task["params"] is not None else None
+            elapsed = time.perf_counter() - started
+            return {"label": task["label"], "rows": rows, "seconds": elapsed, "attempts": attempt}
+        except Exception as exc:  # retried below; re-raised after MAX_RETRIES
+            last_error = exc
+            print(f"  ! {task['label']} attempt {attempt}/{MAX_RETRIES} failed: {exc}")
+            if attempt < MAX_RETRIES:
+                time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+    raise RuntimeError(f"{task['label']} failed after {MAX_RETRIES} attempts") from last_error
+
+
+def main() -> None:
+    """Run ETL steps in dependency order, slicing fact loads across the pool."""
+    run_started = time.perf_counter()
+    done: List[str] = []
+    pending = list(STEPS)
+
+    with ConnectionPool(PG_DSN, min_size=1, max_size=WORKERS, kwargs={"autocommit": True}) as pool, ThreadPoolExecutor(WORKERS) as executor:
+        while pending:
+            ready = [s for s in pending if all(dep in done for dep in s["depends_on"])]
+            if not ready:
+                raise RuntimeError(f"Unresolvable step dependencies: {[s['name'] for s in pending]}")
+
+            print(f"Running: {', '.join(s['name'] for s in ready)}")
+            tasks = [t for s in ready for t in build_tasks(pool, s)]
+            futures = [executor.submit(run_task, pool, t) for t in tasks]
+            for fut in as_completed(futures):
+                r = fut.result()
+                retried = f" after {r['attempts']} attempts" if r["attempts"] > 1 else ""
+                if r["rows"] is None:
+                    print(f"  - {r['label']}: done in {r['seconds']:.2f}s (rows/sec n/a){retried}")
+                    continue
+                rate = r["rows"] / r["seconds"] if r["seconds"] > 0 else 0.0
+                print(f"  - {r['label']}: {r['rows']} rows in {r['seconds']:.2f}s ({rate:,.0f} rows/sec){retried}")
+
+            for s in ready:
+                done.append(s["name"])
+                pending.remove(s)
+
+    print(f"\n✅ ETL finished in {time.perf_counter() - run_started:.2f}s with {WORKERS} workers")
+
+
+if __name__ == "__main__":
+    main()
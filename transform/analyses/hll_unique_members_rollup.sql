@@ -0,0 +1,13 @@
+-- Unique enrolled members by year x state x metal tier, merged from the
+-- normalizer's HLL sketches instead of count(distinct) over dim_member.
+-- Compile with `dbt compile -s hll_unique_members_rollup` and run the SQL in
+-- target/compiled/.
+{% set normalizer_by_profile %}
+(
+    select n.year, p.state, p.plan_metal, n.unique_members_hll
+    from {{ ref('agg_trend_normalizer') }} n
+    join {{ ref('dim_member_profile') }} p on p.profile_id = n.profile_id
+)
+{% endset %}
+{{ hll_rollup(normalizer_by_profile, ['year', 'state', 'plan_metal']) }}
+order by year, state, plan_metal
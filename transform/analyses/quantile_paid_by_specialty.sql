@@ -0,0 +1,18 @@
+-- Median / p90 / p95 / p99 paid and allowed per claim by provider specialty,
+-- merged from agg_provider_performance's quantile sketches instead of
+-- percentile_cont over fct_claim.
+-- Compile with `dbt compile -s quantile_paid_by_specialty` and run the SQL in
+-- target/compiled/.
+with paid as (
+    {{ quantile_rollup(ref('agg_provider_performance'), ['specialty'], 'paid_amount_sketch') }}
+),
+allowed as (
+    {{ quantile_rollup(ref('agg_provider_performance'), ['specialty'], 'allowed_amount_sketch') }}
+)
+select specialty,
+       paid.paid_amount_count as claims,
+       paid.paid_amount_p50, paid.paid_amount_p90, paid.paid_amount_p95, paid.paid_amount_p99,
+       allowed.allowed_amount_p50, allowed.allowed_amount_p95
+from paid
+join allowed using (specialty)
+order by specialty
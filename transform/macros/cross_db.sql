@@ -0,0 +1,46 @@
+{#
+  Adapter-aware helpers for the few Postgres-only constructs in the models.
+  Each macro dispatches on target.type: default__ is the Postgres SQL the
+  models always used, duckdb__ is the equivalent for the local DuckDB target.
+#}
+
+{# One row per day between start_date and end_date (inclusive), as column `column_name`. #}
+{% macro date_series(start_date, end_date, column_name='d') -%}
+  {{ return(adapter.dispatch('date_series', 'aca_health_dw')(start_date, end_date, column_name)) }}
+{%- endmacro %}
+
+{% macro default__date_series(start_date, end_date, column_name) -%}
+  select generate_series(date '{{ start_date }}', date '{{ end_date }}', interval '1 day')::date as {{ column_name }}
+{%- endmacro %}
+
+{% macro duckdb__date_series(start_date, end_date, column_name) -%}
+  select unnest(generate_series(date '{{ start_date }}', date '{{ end_date }}', interval '1 day'))::date as {{ column_name }}
+{%- endmacro %}
+
+
+{# Three-letter month name, e.g. 'Jan'. #}
+{% macro month_abbr(date_expr) -%}
+  {{ return(adapter.dispatch('month_abbr', 'aca_health_dw')(date_expr)) }}
+{%- endmacro %}
+
+{% macro default__month_abbr(date_expr) -%}
+  to_char({{ date_expr }}, 'Mon')
+{%- endmacro %}
+
+{% macro duckdb__month_abbr(date_expr) -%}
+  strftime({{ date_expr }}, '%b')
+{%- endmacro %}
+
+
+{# Three-letter weekday name, e.g. 'Mon'. #}
+{% macro day_abbr(date_expr) -%}
+  {{ return(adapter.dispatch('day_abbr', 'aca_health_dw')(date_expr)) }}
+{%- endmacro %}
+
+{% macro default__day_abbr(date_expr) -%}
+  to_char({{ date_expr }}, 'Dy')
+{%- endmacro %}
+
+{% macro duckdb__day_abbr(date_expr) -%}
+  strftime({{ date_expr }}, '%a')
+{%- endmacro %}
@@ -0,0 +1,63 @@
+{#
+  Seed materialization for the local DuckDB target.
+
+  Instead of loading each CSV row-by-row (what `dbt seed` does on Postgres),
+  the seed relation is created as a view over the file itself, so
+  staging.claims_raw & friends read the generated CSVs in-process with no
+  load step. Column types come from the same `column_types` config in
+  seeds/properties.yml that drives the Postgres load.
+
+  vars:
+    duckdb_seed_dir    : directory holding stable-named seed files
+                         (members.csv, claims.csv, ...; default: this
+                         project's seeds/ folder), e.g. a full-scale copy of
+                         transform/seeds. Relative paths resolve from transform/.
+    duckdb_seed_format : 'csv' (default) or 'parquet' (expects <seed>.parquet
+                         files with the same names; nothing in the repo writes them).
+#}
+{% materialization seed, adapter='duckdb' %}
+
+  {%- set target_relation = this.incorporate(type='view') -%}
+  {%- set old_relation = adapter.get_relation(database=database, schema=schema, identifier=model['alias']) -%}
+
+  {%- set seed_dir = var('duckdb_seed_dir', model['root_path'] ~ '/' ~ (model['original_file_path'] | replace(model['name'] ~ '.csv', ''))) -%}
+  {%- set seed_format = var('duckdb_seed_format', 'csv') -%}
+  {%- set seed_path = seed_dir.rstrip('/') ~ '/' ~ model['name'] ~ '.' ~ seed_format -%}
+
+  {%- if seed_format == 'parquet' -%}
+    {%- set reader = "read_parquet('" ~ seed_path ~ "')" -%}
+  {%- else -%}
+    {%- set column_types = config.get('column_types', {}) -%}
+    {%- set type_pairs = [] -%}
+    {%- for column_name, column_type in column_types.items() -%}
+      {%- do type_pairs.append("'" ~ column_name ~ "': '" ~ column_type ~ "'") -%}
+    {%- endfor -%}
+    {#- strict_mode off: hand-appended seed rows can end in \n while the generator writes \r\n -#}
+    {%- set reader = "read_csv('" ~ seed_path ~ "', header=true, strict_mode=false, types={" ~ (type_pairs | join(', ')) ~ "})" -%}
+  {%- endif -%}
+
+  {{ run_hooks(pre_hooks, inside_transaction=False) }}
+  {{ run_hooks(pre_hooks, inside_transaction=True) }}
+
+  {% if old_relation is not none and old_relation.is_table %}
+    {% do adapter.drop_relation(old_relation) %}
+  {% endif %}
+
+  {% call statement('main') -%}
+    create or replace view {{ target_relation }} as
+    select * from {{ reader }}
+  {%- endcall %}
+
+  {# the seed task expects an agate table; hand it the (empty) header only #}
+  {%- set header_only = run_query('select * from ' ~ target_relation ~ ' limit 0') -%}
+  {%- do store_result('agate_table', response='OK', agate_table=header_only) -%}
+
+  {{ run_hooks(post_hooks, inside_transaction=True) }}
+
+  {{ adapter.commit() }}
+
+  {{ run_hooks(post_hooks, inside_transaction=False) }}
+
+  {{ return({'relations': [target_relation]}) }}
+
+{% endmaterialization %}
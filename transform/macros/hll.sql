@@ -0,0 +1,110 @@
+{#
+  HyperLogLog distinct-count sketches in plain SQL (Postgres and DuckDB).
+
+  A sketch is an integer array of (register << 6) | rank entries. The low
+  `hll_precision` bits of a 60-bit md5 hash pick the register and the rank is
+  1 + the number of trailing zero bits in the remaining hash bits. A sketch
+  keeps only the highest rank per register (at most 2^p entries); merging does
+  the same across cells, so the sketches of any set of cells can be unioned and
+  re-estimated without going back to fct_claim / dim_member.
+
+  Error bounds (m = 2^p registers):
+    - standard error 1.04 / sqrt(m): 0.81% at the default p = 14
+      (about 1.6% for 95% of estimates)
+    - below 2.5 * m distinct values (40,960 at p = 14) the estimate switches
+      to linear counting, which is tighter still (about 0.5% at 1,000 values)
+
+  vars:
+    hll_precision : register bits p (default 14, 4..16). Sketches built with
+                    different precisions cannot be merged.
+#}
+
+{# 60-bit non-negative hash of any value; identical on both adapters. #}
+{% macro hll_hash(expr) -%}
+  {{ return(adapter.dispatch('hll_hash', 'aca_health_dw')(expr)) }}
+{%- endmacro %}
+
+{% macro default__hll_hash(expr) -%}
+  ('x' || substr(md5(cast({{ expr }} as varchar)), 1, 15))::bit(60)::bigint
+{%- endmacro %}
+
+{% macro duckdb__hll_hash(expr) -%}
+  ('0x' || substr(md5(cast({{ expr }} as varchar)), 1, 15))::bigint
+{%- endmacro %}
+
+
+{# Sketch entry (register << 6) | rank for one value. #}
+{% macro hll_entry(expr) -%}
+  {%- set p = var('hll_precision', 14) -%}
+  {%- set rest = '((' ~ hll_hash(expr) ~ ') >> ' ~ p ~ ')' -%}
+  cast(
+    (((({{ hll_hash(expr) }}) & {{ 2 ** p - 1 }}) << 6)
+     | (case when {{ rest }} = 0 then {{ 61 - p }}
+             else cast(round(ln({{ rest }} & (-{{ rest }})) / ln(2)) as integer) + 1 end))
+    as integer)
+{%- endmacro %}
+
+
+{#
+  Aggregate: sketch of the distinct non-null values of expr in each group,
+  compacted to the highest rank per register so it holds at most 2^p entries.
+#}
+{% macro hll_sketch(expr) -%}
+  (
+    select array_agg(cast((hll_register << 6) | hll_rank as integer) order by hll_register)
+    from (
+      select hll_entries.v >> 6 as hll_register, max(hll_entries.v & 63) as hll_rank
+      from unnest(array_agg(distinct {{ hll_entry(expr) }}) filter (where {{ expr }} is not null)) as hll_entries(v)
+      group by hll_entries.v >> 6
+    ) as hll_registers
+  )
+{%- endmacro %}
+
+
+{# Scalar: estimated distinct count of a sketch column (0 for a null sketch). #}
+{% macro hll_estimate(sketch) -%}
+  {%- set m = 2 ** var('hll_precision', 14) -%}
+  {%- set alpha = 0.7213 / (1 + 1.079 / m) -%}
+  coalesce((
+    select round(case when hll_zeros > 0 and hll_raw <= {{ 2.5 * m }}
+                      then {{ m }} * ln({{ m }}.0 / hll_zeros)
+                      else hll_raw end)
+    from (
+      select {{ alpha * m * m }} / ({{ m }} - count(*) + sum(power(2.0, -hll_rank))) as hll_raw,
+             {{ m }} - count(*) as hll_zeros
+      from (
+        select hll_entries.v >> 6 as hll_register, max(hll_entries.v & 63) as hll_rank
+        from unnest({{ sketch }}) as hll_entries(v)
+        group by hll_entries.v >> 6
+      ) as hll_registers
+    ) as hll_summary
+  ), 0)
+{%- endmacro %}
+
+
+{#
+  Roll a sketch column up to a coarser grain: one row per group_by combination
+  (group_by may be empty for a grand total) with the merged sketch (same column
+  name) and `<estimate_column>`.
+
+    {{ hll_rollup(ref('agg_plan_performance_cube'), ['plan_id']) }}
+
+  `relation` may also be a parenthesised subquery, e.g. a cube joined to
+  dim_member_profile to roll up by member attributes.
+#}
+{% macro hll_rollup(relation, group_by, sketch_column='unique_members_hll', estimate_column='unique_members_estimate') -%}
+  with hll_registers as (
+      select {% for c in group_by %}cell.{{ c }}, {% endfor %}
+             hll_entries.v >> 6 as hll_register,
+             max(hll_entries.v & 63) as hll_rank
+      from {{ relation }} as cell, unnest(cell.{{ sketch_column }}) as hll_entries(v)
+      group by {% for c in group_by %}cell.{{ c }}, {% endfor %}hll_entries.v >> 6
+  ),
+  hll_merged as (
+      select {% for c in group_by %}{{ c }}, {% endfor %}array_agg(cast((hll_register << 6) | hll_rank as integer)) as {{ sketch_column }}
+      from hll_registers
+      {% if group_by %}group by {{ group_by | join(', ') }}{% endif %}
+  )
+  select {% for c in group_by %}{{ c }}, {% endfor %}{{ sketch_column }}, {{ hll_estimate(sketch_column) }} as {{ estimate_column }}
+  from hll_merged
+{%- endmacro %}
@@ -0,0 +1,139 @@
+{#
+  Relative-error quantile sketches (DDSketch-style) in plain SQL (Postgres and DuckDB).
+
+  Positive values fall into logarithmic buckets: bucket k holds
+  (gamma^(k-1), gamma^k] with gamma = (1 + a) / (1 - a), and is estimated by
+  2 * gamma^k / (gamma + 1), which is within a relative error a of every
+  value in it. Zero and negative values share one bucket that is estimated as 0.
+  A sketch is a bigint array of (slot << 32) | count entries, one per non-empty
+  bucket (slot = k + 2^20, slot 0 = the zero bucket). Merging sums the counts
+  per slot, so the sketches of any set of cells can be combined and queried
+  for any percentile without going back to fct_claim.
+
+  Error bounds:
+    - every estimated quantile is within the relative accuracy a of the value
+      at that rank (1% at the default); percentiles are interpolated between
+      neighbouring ranks like percentile_cont
+    - size is bounded by the value range, not the row count: amounts from
+      $0.01 to $1M need at most ~920 buckets at a = 1%
+
+  vars:
+    quantile_sketch_accuracy : relative accuracy a (default 0.01). Sketches
+                               built with different accuracies cannot be merged.
+#}
+
+{% macro _quantile_gamma() -%}
+  {%- set a = var('quantile_sketch_accuracy', 0.01) -%}
+  {{- return((1 + a) / (1 - a)) -}}
+{%- endmacro %}
+
+
+{# Bucket slot (bigint) for one value; non-positive values go to slot 0. #}
+{% macro quantile_slot(expr) -%}
+  cast(case when {{ expr }} > 0
+            then ceil(ln(cast({{ expr }} as float8)) / ln(cast({{ _quantile_gamma() }} as float8))) + {{ 2 ** 20 }}
+            else 0 end as bigint)
+{%- endmacro %}
+
+
+{# Scalar: estimated value of a bucket slot. #}
+{% macro quantile_slot_value(slot) -%}
+  {%- set gamma = _quantile_gamma() -%}
+  case when ({{ slot }}) = 0 then 0
+       else 2 * power(cast({{ gamma }} as float8), ({{ slot }}) - {{ 2 ** 20 }}) / {{ gamma + 1 }} end
+{%- endmacro %}
+
+
+{#
+  Build one sketch of value_column per group_by combination:
+
+    {{ quantile_sketch('claims', ['provider_id'], 'paid_amount') }}
+
+  returns group_by columns (may be empty) plus `<sketch_column>` (default
+  `<value_column>_sketch`). Null values are skipped. `relation` may be a CTE
+  name, ref() or a parenthesised subquery.
+#}
+{% macro quantile_sketch(relation, group_by, value_column, sketch_column=none) -%}
+  {%- set sketch_column = sketch_column or value_column ~ '_sketch' -%}
+  select {% for c in group_by %}{{ c }}, {% endfor %}array_agg(qs_entry order by qs_entry) as {{ sketch_column }}
+  from (
+      select {% for c in group_by %}{{ c }}, {% endfor %}(qs_slot << 32) | count(*) as qs_entry
+      from (
+          select {% for c in group_by %}cell.{{ c }}, {% endfor %}{{ quantile_slot('cell.' ~ value_column) }} as qs_slot
+          from {{ relation }} as cell
+          where cell.{{ value_column }} is not null
+      ) as qs_values
+      group by {% for c in group_by %}{{ c }}, {% endfor %}qs_slot
+  ) as qs_buckets
+  {% if group_by %}group by {{ group_by | join(', ') }}{% endif %}
+{%- endmacro %}
+
+
+{# Scalar: estimated quantile q (0..1) of a single sketch column (null for a null sketch). #}
+{% macro quantile_estimate(sketch, q) -%}
+  (
+    select qs_lo + (qs_hi - qs_lo) * ({{ q }} * (qs_total - 1) - floor({{ q }} * (qs_total - 1)))
+    from (
+      select min(qs_value) filter (where qs_upto > floor({{ q }} * (qs_total - 1))) as qs_lo,
+             min(qs_value) filter (where qs_upto > ceil({{ q }} * (qs_total - 1))) as qs_hi,
+             max(qs_total) as qs_total
+      from (
+        select {{ quantile_slot_value('qs_entries.v >> 32') }} as qs_value,
+               sum(qs_entries.v & {{ 2 ** 32 - 1 }}) over (order by qs_entries.v rows between unbounded preceding and current row) as qs_upto,
+               sum(qs_entries.v & {{ 2 ** 32 - 1 }}) over () as qs_total
+        from unnest({{ sketch }}) as qs_entries(v)
+      ) as qs_ranked
+    ) as qs_bounds
+    where qs_total > 0
+  )
+{%- endmacro %}
+
+
+{#
+  Merge a sketch column up to a coarser grain and answer percentiles: one row
+  per group_by combination (group_by may be empty for a grand total) with the
+  merged sketch (same column name), `<prefix>_count` and `<prefix>_p<q>` for
+  each quantile (0.5 -> _p50, 0.999 -> _p99_9).
+
+    {{ quantile_rollup(ref('agg_provider_performance'), ['specialty'], 'paid_amount_sketch') }}
+
+  prefix defaults to the sketch column without its `_sketch` suffix.
+  `relation` may also be a parenthesised subquery, e.g. a cube joined to a dim.
+#}
+{% macro quantile_rollup(relation, group_by, sketch_column, quantiles=[0.5, 0.9, 0.95, 0.99], prefix=none) -%}
+  {%- set prefix = prefix or sketch_column | replace('_sketch', '') -%}
+  {%- set partition = ('partition by ' ~ group_by | join(', ')) if group_by else '' -%}
+  with qs_buckets as (
+      select {% for c in group_by %}cell.{{ c }}, {% endfor %}
+             qs_entries.v >> 32 as qs_slot,
+             cast(sum(qs_entries.v & {{ 2 ** 32 - 1 }}) as bigint) as qs_count
+      from {{ relation }} as cell, unnest(cell.{{ sketch_column }}) as qs_entries(v)
+      group by {% for c in group_by %}cell.{{ c }}, {% endfor %}qs_entries.v >> 32
+  ),
+  qs_ranked as (
+      select qs_buckets.*,
+             {{ quantile_slot_value('qs_slot') }} as qs_value,
+             sum(qs_count) over ({{ partition }} order by qs_slot rows between unbounded preceding and current row) as qs_upto,
+             sum(qs_count) over ({{ partition }}) as qs_total
+      from qs_buckets
+  ),
+  qs_bounds as (
+      select {% for c in group_by %}{{ c }}, {% endfor %}
+             array_agg((qs_slot << 32) | qs_count order by qs_slot) as {{ sketch_column }},
+             {%- for q in quantiles %}
+             min(qs_value) filter (where qs_upto > floor({{ q }} * (qs_total - 1))) as qs_lo_{{ loop.index }},
+             min(qs_value) filter (where qs_upto > ceil({{ q }} * (qs_total - 1))) as qs_hi_{{ loop.index }},
+             {%- endfor %}
+             max(qs_total) as qs_total
+      from qs_ranked
+      {% if group_by %}group by {{ group_by | join(', ') }}{% endif %}
+  )
+  select {% for c in group_by %}{{ c }}, {% endfor %}
+         {{ sketch_column }},
+         qs_total as {{ prefix }}_count
+         {%- for q in quantiles %},
+         qs_lo_{{ loop.index }} + (qs_hi_{{ loop.index }} - qs_lo_{{ loop.index }})
+             * ({{ q }} * (qs_total - 1) - floor({{ q }} * (qs_total - 1))) as {{ prefix }}_p{{ ('%g' | format(q * 100)) | replace('.', '_') }}
+         {%- endfor %}
+  from qs_bounds
+{%- endmacro %}
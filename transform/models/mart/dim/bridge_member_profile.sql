@@ -0,0 +1,56 @@
+{{ config(
+    materialized='table',
+    schema='dw',
+    indexes=[{'columns': ['member_id'], 'unique': True}, {'columns': ['profile_id']}]
+) }}
+-- Member -> profile_id bridge for the dim_member_profile junk dimension.
+-- The geographic_reporting CASE and derived flags are computed once per member here,
+-- and every distinct attribute combination gets a dense integer profile_id.
+-- profile_id is a dense_rank over exactly the cubes' former grouping columns, so keying
+-- the cubes on it leaves their row counts unchanged and only narrows them.
+-- Ids are assigned per build: only compare them between relations from the same run.
+
+with member_attributes as (
+    select
+        member_id,
+        year,
+        hios_id,
+        state,
+        plan_network_access_type,
+        plan_metal,
+        age_group,
+        gender,
+        region,
+        case
+            when substr(hios_id, 1, 5) = '29341' then 'OHB (Columbus)'
+            when substr(hios_id, 1, 5) = '45845' then 'OHC (Cleveland Clinic Product)'
+            when state = 'TX' then concat(state, '-', plan_network_access_type)
+            else state
+        end as geographic_reporting,
+        clinical_segment,
+        general_agency_name,
+        broker_name,
+        sa_contracting_entity_name,
+        enrollment_length_continuous,
+        case when enrollment_length_continuous <= 5 then 1 else 0 end as new_member_in_period,
+        case when call_count > 0 then 1 else 0 end as member_called_oscar,
+        member_used_app,
+        member_had_web_login,
+        member_visited_new_provider_ind,
+        high_cost_member,
+        mutually_exclusive_hcc_condition,
+        wisconsin_area_deprivation_index
+    from {{ ref('dim_member') }}
+)
+
+select
+    dense_rank() over (
+        order by hios_id, state, plan_network_access_type, plan_metal, age_group, gender,
+            region, geographic_reporting, clinical_segment, general_agency_name, broker_name,
+            sa_contracting_entity_name, enrollment_length_continuous, new_member_in_period,
+            member_called_oscar, member_used_app, member_had_web_login,
+            member_visited_new_provider_ind, high_cost_member, mutually_exclusive_hcc_condition,
+            wisconsin_area_deprivation_index
+    ) as profile_id,
+    member_attributes.*
+from member_attributes
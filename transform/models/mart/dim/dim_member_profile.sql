@@ -0,0 +1,33 @@
+{{ config(
+    materialized='table',
+    schema='dw',
+    indexes=[{'columns': ['profile_id'], 'unique': True}]
+) }}
+-- Junk dimension: one row per distinct combination of the member attributes the
+-- trend cubes slice by. The cubes carry only profile_id, so descriptor-to-normalizer
+-- joins are a single integer equi-join on (year, profile_id).
+
+select distinct
+    profile_id,
+    hios_id,
+    state,
+    plan_network_access_type,
+    plan_metal,
+    age_group,
+    gender,
+    region,
+    geographic_reporting,
+    clinical_segment,
+    general_agency_name,
+    broker_name,
+    sa_contracting_entity_name,
+    enrollment_length_continuous,
+    new_member_in_period,
+    member_called_oscar,
+    member_used_app,
+    member_had_web_login,
+    member_visited_new_provider_ind,
+    high_cost_member,
+    mutually_exclusive_hcc_condition,
+    wisconsin_area_deprivation_index
+from {{ ref('bridge_member_profile') }}
@@ -1,4 +1,12 @@
-{{ config(materialized='view', schema='dw') }}
+{{ config(
+    materialized='incremental',
+    unique_key='provider_id',
+    schema='dw',
+    indexes=[{'columns': ['provider_id'], 'unique': target.type == 'postgres'}]
+) }}
+-- Current rows materialized once and indexed on the natural key; incremental runs
+-- only re-read keys whose snapshot version changed since the last refresh.
+-- DuckDB rejects the delete+insert of a changed key against a unique index, so it gets a plain one
 -- moved from analytics to mart
 select
     s.provider_id,
@@ -15,3 +23,7 @@ select
     (s.dbt_valid_to is null) as is_current
 from {{ ref('provider_snapshot') }} s
 where s.dbt_valid_to is null
+{% if is_incremental() %}
+  -- only keys whose current version was written by a snapshot run since the last refresh
+  and s.dbt_valid_from > (select max(validity_start_ts) from {{ this }})
+{% endif %}
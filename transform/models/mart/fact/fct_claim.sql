@@ -1,4 +1,4 @@
-{{ config(materialized='incremental', unique_key='claim_id', schema='dw') }}
+{{ config(materialized='incremental', unique_key='claim_id', schema='dw', on_schema_change='append_new_columns') }}
 -- Fat fact table with all descriptor fields for efficient analysis
 -- Includes claim metrics and dimensional attributes from staging
 
@@ -69,7 +69,18 @@ select
     
     -- Clinical classification (CCSR)
     c.ccsr_system_description,
-    c.ccsr_description
+    c.ccsr_description,
+
+    -- Staging load batch (null for seed loads)
+    c.load_id
 
 from claims c
 left join dim_member dm using (member_id)
+{% if is_incremental() and var('claims_feed_watermark', false) %}
+{%- set loaded_columns = adapter.get_columns_in_relation(this) | map(attribute='name') | map('lower') | list %}
+{% if 'load_id' in loaded_columns %}
+-- claims feed runs (scripts/simulate_claims_feed.py): merge only micro-batches past the loaded
+-- load_id watermark. Without the var every staged claim is merged, including seed rows (no load_id).
+where c.load_id > (select coalesce(max(t.load_id), 0) from {{ this }} t)
+{% endif %}
+{% endif %}
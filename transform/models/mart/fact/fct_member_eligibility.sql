@@ -0,0 +1,30 @@
+{{ config(materialized='incremental', unique_key=['member_id', 'plan_id', 'coverage_year'], schema='dw') }}
+-- Member x month eligibility grid: one row per member / plan / coverage year.
+-- Bit (m - 1) of month_mask is set when the member is covered on the 15th of month m
+-- (mid-month rule), so member_months is the same whole-month count in every cube.
+with enrollments as (
+    select member_id, plan_id, start_date, end_date
+    from {{ ref('fct_enrollment') }}
+    {% if is_incremental() %}
+    -- enrollments arrive in date order: re-derive the latest loaded year onward
+    -- (late enrollments for earlier years need --full-refresh)
+    where extract(year from end_date) >= (select max(coverage_year) from {{ this }})
+    {% endif %}
+),
+mid_months as (
+    select full_date, year, month
+    from {{ ref('dim_date') }}
+    where day = 15
+    {% if is_incremental() %}
+      and year >= (select max(coverage_year) from {{ this }})
+    {% endif %}
+)
+select
+    e.member_id,
+    e.plan_id,
+    d.year as coverage_year,
+    bit_or(1 << (d.month - 1)) as month_mask,
+    count(distinct d.month) as member_months
+from enrollments e
+join mid_months d on d.full_date between e.start_date and e.end_date
+group by e.member_id, e.plan_id, d.year
@@ -1,6 +1,14 @@
 -- Staging model for claims with deduplication
 {{ config(materialized='view', schema='staging') }}
 
+-- Seed loads have no load_id; the claims feed simulator appends versioned rows
+-- (pending, then PAID/DENIED) with load_id, so keep the latest load per claim.
+{%- set source_columns = [] -%}
+{%- if execute -%}
+  {%- set source_columns = adapter.get_columns_in_relation(source('staging', 'claims_raw')) | map(attribute='name') | map('lower') | list -%}
+{%- endif -%}
+{%- set has_load_id = 'load_id' in source_columns %}
+
 with source as (
     select * from {{ source('staging', 'claims_raw') }}
 ),
@@ -10,7 +18,11 @@ deduped as (
         *,
         row_number() over (
             partition by claim_id 
+            {% if has_load_id -%}
+            order by load_id desc nulls last
+            {%- else -%}
             order by claim_id  -- All rows identical after seed load, no timestamp needed
+            {%- endif %}
         ) as row_num
     from source
 ),
@@ -60,7 +72,12 @@ final as (
         best_contracting_entity_name,
         provider_group_name,
         ccsr_system_description,
-        ccsr_description
+        ccsr_description,
+        {% if has_load_id -%}
+        load_id
+        {%- else -%}
+        cast(null as bigint) as load_id
+        {%- endif %}
     from deduped
     where row_num = 1
 )
@@ -9,6 +9,7 @@ select
     sum(paid_amount) as total_paid_amount,
     avg(claim_amount) as avg_claim_amount,
     count(distinct member_id) as unique_members_with_claims,
+    {{ hll_sketch('member_id') }} as unique_members_hll,
     count(distinct provider_id) as unique_providers,
     case when sum(claim_amount) > 0 then sum(allowed_amount) / sum(claim_amount) else 0 end as allowance_ratio,
     case when sum(allowed_amount) > 0 then sum(paid_amount) / sum(allowed_amount) else 0 end as payment_ratio,
@@ -2,21 +2,34 @@
 
 -- Member cost cube (member x cost metrics)
 -- Renamed from agg_member_cost to enforce cube naming convention (multi-dimension)
--- Source: dim_member + fct_claim + fct_enrollment aggregated in prior logic.
+-- Source: dim_member + fct_claim + fct_member_eligibility.
 
--- Reuse original logic from agg_member_cost (kept identical)
+-- Claim metrics follow agg_member_cost. Enrollment months differ: they are whole
+-- member months from fct_member_eligibility (mid-month rule, coverage years 2025+)
+-- summed per member across plans, not coverage_days / 30.44 per member and plan.
 with member_enrollment_months as (
-    select e.member_id, e.plan_id, sum(e.coverage_days) / 30.44 as total_enrollment_months
-    from {{ ref('fct_enrollment') }} e
-    where e.start_date >= '2025-01-01'
-    group by e.member_id, e.plan_id
+    -- whole member months from the shared eligibility grid
+    select g.member_id, sum(g.member_months) as total_enrollment_months
+    from {{ ref('fct_member_eligibility') }} g
+    where g.coverage_year >= 2025
+    group by g.member_id
+),
+claims as (
+    select * from {{ ref('fct_claim') }}
+    where claim_date >= '2025-01-01'
 ),
 member_claims_cost as (
     select c.member_id, count(c.claim_id) as total_claims, sum(c.claim_amount) as total_billed, sum(c.allowed_amount) as total_allowed, sum(c.paid_amount) as total_paid
-    from {{ ref('fct_claim') }} c
-    where c.claim_date >= '2025-01-01'
+    from claims c
     group by c.member_id
 ),
+-- mergeable per-claim amount distributions (null without claims): roll up by member attributes with quantile_rollup()
+paid_sketches as (
+    {{ quantile_sketch('claims', ['member_id'], 'paid_amount') }}
+),
+allowed_sketches as (
+    {{ quantile_sketch('claims', ['member_id'], 'allowed_amount') }}
+),
 member_demographics as (
     select member_id, age_group, gender, region, plan_metal, is_current
     from {{ ref('dim_member') }}
@@ -27,6 +40,8 @@ select md.member_id, md.age_group, md.gender, md.region, md.plan_metal,
     coalesce(mcc.total_billed, 0) as total_billed_amount,
     coalesce(mcc.total_allowed, 0) as total_allowed_amount,
     coalesce(mcc.total_paid, 0) as total_paid_amount,
+    ps.paid_amount_sketch,
+    als.allowed_amount_sketch,
     case when coalesce(mem.total_enrollment_months, 0) > 0 then coalesce(mcc.total_paid, 0) / mem.total_enrollment_months else 0 end as pmpm_cost,
     case when coalesce(mem.total_enrollment_months, 0) > 0 then (coalesce(mcc.total_paid, 0) / mem.total_enrollment_months) * 12 else 0 end as pmpy_cost,
     case when coalesce(mem.total_enrollment_months, 0) > 0 then coalesce(mcc.total_claims, 0) / mem.total_enrollment_months else 0 end as claims_per_member_per_month,
@@ -40,5 +55,7 @@ select md.member_id, md.age_group, md.gender, md.region, md.plan_metal,
 from member_demographics md
 left join member_enrollment_months mem on md.member_id = mem.member_id
 left join member_claims_cost mcc on md.member_id = mcc.member_id
+left join paid_sketches ps on md.member_id = ps.member_id
+left join allowed_sketches als on md.member_id = als.member_id
 where md.is_current = true
 order by total_paid_amount desc
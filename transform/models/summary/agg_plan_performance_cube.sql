@@ -1,27 +1,47 @@
 {{ config(materialized='table', schema='summary') }}
 
 -- Plan performance cube (plan x month)
-with plan_claims as (
+with claims as (
     select p.plan_id,
            date_trunc('month', c.claim_date) as report_month,
+           c.claim_id, c.member_id, c.claim_status,
+           c.claim_amount, c.allowed_amount, c.paid_amount
+    from {{ ref('fct_claim') }} c
+    join {{ ref('dim_plan') }} p on c.plan_id = p.plan_id
+    where c.claim_date >= '2025-01-01'
+),
+plan_claims as (
+    select c.plan_id,
+           c.report_month,
            count(c.claim_id) as total_claims,
            sum(c.claim_amount) as total_billed_amount,
            sum(c.allowed_amount) as total_allowed_amount,
            sum(c.paid_amount) as total_paid_amount,
            count(distinct c.member_id) as unique_members_with_claims,
+           {{ hll_sketch('c.member_id') }} as unique_members_hll,
            sum(case when c.claim_status = 'approved' then 1 else 0 end) as approved_claims,
            sum(case when c.claim_status = 'denied' then 1 else 0 end) as denied_claims
-    from {{ ref('fct_claim') }} c
-    join {{ ref('dim_plan') }} p on c.plan_id = p.plan_id
-    where c.claim_date >= '2025-01-01'
+    from claims c
     group by 1,2
 ),
+-- mergeable per-claim amount distributions: percentiles at any grain with quantile_rollup()
+paid_sketches as (
+    {{ quantile_sketch('claims', ['plan_id', 'report_month'], 'paid_amount') }}
+),
+allowed_sketches as (
+    {{ quantile_sketch('claims', ['plan_id', 'report_month'], 'allowed_amount') }}
+),
 plan_enrollment as (
-    select e.plan_id,
-           date_trunc('month', e.start_date) as report_month,
-           sum(e.coverage_days)/30.44 as member_months
-    from {{ ref('fct_enrollment') }} e
-    where e.start_date >= '2025-01-01'
+    -- expand each eligibility month_mask bit into a plan x month member count
+    select g.plan_id,
+           date_trunc('month', d.full_date) as report_month,
+           count(*) as member_months
+    from {{ ref('fct_member_eligibility') }} g
+    join {{ ref('dim_date') }} d
+      on d.year = g.coverage_year
+     and d.day = 1
+     and ((g.month_mask >> (d.month - 1)) & 1) = 1
+    where g.coverage_year >= 2025
     group by 1,2
 )
 select pc.plan_id,
@@ -31,6 +51,9 @@ select pc.plan_id,
        pc.total_allowed_amount,
        pc.total_paid_amount,
        pc.unique_members_with_claims,
+       pc.unique_members_hll,
+       ps.paid_amount_sketch,
+       als.allowed_amount_sketch,
        coalesce(pe.member_months,0) as member_months,
        case when pc.total_billed_amount>0 then pc.total_allowed_amount/pc.total_billed_amount else 0 end as allowance_ratio,
        case when pc.total_allowed_amount>0 then pc.total_paid_amount/pc.total_allowed_amount else 0 end as payment_ratio,
@@ -39,4 +62,6 @@ select pc.plan_id,
        pc.denied_claims
 from plan_claims pc
 left join plan_enrollment pe using(plan_id, report_month)
+left join paid_sketches ps using(plan_id, report_month)
+left join allowed_sketches als using(plan_id, report_month)
 order by report_month, plan_id
@@ -1,10 +1,15 @@
 {{ config(materialized='table', schema='summary') }}
 
 -- Provider performance analysis moved to summary schema
-with provider_claims as (
+with claims as (
+    select * from {{ ref('fct_claim') }}
+    where claim_date >= '2025-01-01'
+),
+provider_claims as (
     select c.provider_id,
         count(c.claim_id) as total_claims,
         count(distinct c.member_id) as unique_members_served,
+        {{ hll_sketch('c.member_id') }} as unique_members_hll,
         sum(c.claim_amount) as total_billed,
         sum(c.allowed_amount) as total_allowed,
         sum(c.paid_amount) as total_paid,
@@ -14,17 +19,24 @@ with provider_claims as (
         sum(case when c.claim_status = 'pending' then 1 else 0 end) as pending_claims,
         mode() within group (order by c.diagnosis_code) as most_common_diagnosis,
         mode() within group (order by c.procedure_code) as most_common_procedure
-    from {{ ref('fct_claim') }} c
-    where c.claim_date >= '2025-01-01'
+    from claims c
     group by c.provider_id
 ),
+-- mergeable per-claim amount distributions: percentiles at any grain with quantile_rollup()
+paid_sketches as (
+    {{ quantile_sketch('claims', ['provider_id'], 'paid_amount') }}
+),
+allowed_sketches as (
+    {{ quantile_sketch('claims', ['provider_id'], 'allowed_amount') }}
+),
 provider_info as (
     select provider_id, provider_name, specialty, city, state
     from {{ ref('dim_provider') }}
     where is_current = true
 )
 select p.provider_id, pi.provider_name, pi.specialty, pi.city, pi.state,
-    p.total_claims, p.unique_members_served, p.total_billed, p.total_allowed, p.total_paid, p.avg_claim_amount,
+    p.total_claims, p.unique_members_served, p.unique_members_hll, p.total_billed, p.total_allowed, p.total_paid, p.avg_claim_amount,
+    ps.paid_amount_sketch, als.allowed_amount_sketch,
     case when p.total_billed > 0 then p.total_allowed / p.total_billed else 0 end as allowance_ratio,
     case when p.total_allowed > 0 then p.total_paid / p.total_allowed else 0 end as payment_ratio,
     case when p.total_claims > 0 then p.approved_claims::float / p.total_claims else 0 end as approval_rate,
@@ -42,4 +54,6 @@ select p.provider_id, pi.provider_name, pi.specialty, pi.city, pi.state,
          else 'Very Low Cost' end as cost_category
 from provider_claims p
 left join provider_info pi on p.provider_id = pi.provider_id
+left join paid_sketches ps on p.provider_id = ps.provider_id
+left join allowed_sketches als on p.provider_id = als.provider_id
 order by p.total_claims desc
@@ -11,6 +11,7 @@ with claims as (
            sum(case when c.claim_status='approved' then 1 else 0 end) as approved_claims,
            sum(case when c.claim_status='denied' then 1 else 0 end) as denied_claims,
            count(distinct c.member_id) as unique_members,
+           {{ hll_sketch('c.member_id') }} as unique_members_hll,
            count(distinct c.provider_id) as unique_providers
     from {{ ref('fct_claim') }} c
     join {{ ref('dim_provider') }} p on c.provider_id = p.provider_id
@@ -22,6 +23,7 @@ select specialty,
        total_claims,
        unique_providers,
        unique_members,
+       unique_members_hll,
        total_billed_amount,
        total_allowed_amount,
        total_paid_amount,
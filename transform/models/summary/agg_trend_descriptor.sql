@@ -7,14 +7,15 @@
 
 -- Moved from mart to summary folder (path change only). Descriptor cube: claim-level dimensions with aggregated metrics for trend analysis
 -- Built from fat fact table (fct_claim) and dimensions for proper data warehouse layering
+-- Member attributes are carried as dim_member_profile.profile_id instead of ~22 columns
 -- Compares 2024 vs 2025 with pre-aggregated metrics for efficient querying
 
 with claims as (
     select * from {{ ref('fct_claim') }}
 ),
 
-members as (
-    select * from {{ ref('dim_member') }}
+profiles as (
+    select member_id, year, profile_id from {{ ref('bridge_member_profile') }}
 ),
 
 providers as (
@@ -24,32 +25,7 @@ providers as (
 claim_data as (
     select
         extract(year from c.claim_date) as year,
-        m.hios_id,
-        m.state,
-        m.plan_network_access_type,
-        m.plan_metal,
-        m.age_group,
-        m.gender,
-        m.region,
-        m.clinical_segment,
-        m.general_agency_name,
-        m.broker_name,
-        m.sa_contracting_entity_name,
-        m.enrollment_length_continuous,
-        case
-            when substr(m.hios_id, 1, 5) = '29341' then 'OHB (Columbus)'
-            when substr(m.hios_id, 1, 5) = '45845' then 'OHC (Cleveland Clinic Product)'
-            when m.state = 'TX' then concat(m.state, '-', m.plan_network_access_type)
-            else m.state
-        end as geographic_reporting,
-        case when m.enrollment_length_continuous <= 5 then 1 else 0 end as new_member_in_period,
-        case when m.call_count > 0 then 1 else 0 end as member_called_oscar,
-        m.member_used_app,
-        m.member_had_web_login,
-        m.member_visited_new_provider_ind,
-        m.high_cost_member,
-        m.mutually_exclusive_hcc_condition,
-        m.wisconsin_area_deprivation_index,
+        b.profile_id,
         c.claim_type,
         coalesce(c.major_service_category, 'Unmapped') as major_service_category,
         case
@@ -93,35 +69,15 @@ claim_data as (
         c.hcg_units_days,
         c.claim_id
     from claims c
-    inner join members m on c.member_id = m.member_id
-        and extract(year from c.claim_date) = m.year
+    inner join profiles b on c.member_id = b.member_id
+        and extract(year from c.claim_date) = b.year
     left join providers p on c.provider_id = p.provider_id
     where extract(year from c.claim_date) in (2024, 2025)
 )
 
 select
     year,
-    hios_id,
-    state,
-    plan_network_access_type,
-    plan_metal,
-    age_group,
-    gender,
-    region,
-    geographic_reporting,
-    clinical_segment,
-    general_agency_name,
-    broker_name,
-    sa_contracting_entity_name,
-    enrollment_length_continuous,
-    new_member_in_period,
-    member_called_oscar,
-    member_used_app,
-    member_had_web_login,
-    member_visited_new_provider_ind,
-    high_cost_member,
-    mutually_exclusive_hcc_condition,
-    wisconsin_area_deprivation_index,
+    profile_id,
     claim_type,
     major_service_category,
     provider_specialty,
@@ -162,12 +118,7 @@ select
     ) as avg_days_service_to_paid
 from claim_data
 group by 
-    year, hios_id, state, plan_network_access_type, plan_metal, age_group, gender,
-    region, geographic_reporting, clinical_segment, general_agency_name, broker_name,
-    sa_contracting_entity_name, enrollment_length_continuous, new_member_in_period,
-    member_called_oscar, member_used_app, member_had_web_login, 
-    member_visited_new_provider_ind, high_cost_member, mutually_exclusive_hcc_condition,
-    wisconsin_area_deprivation_index, claim_type, major_service_category, provider_specialty,
+    year, profile_id, claim_type, major_service_category, provider_specialty,
     detailed_service_category, ms_drg, ms_drg_mdc, cpt, cpt_consumer_description,
     procedure_level_1, procedure_level_2, procedure_level_3, procedure_level_4,
     procedure_level_5, channel, drug_name, drug_class, drug_subclass, drug_name_full,
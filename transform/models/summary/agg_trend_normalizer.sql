@@ -5,78 +5,43 @@
   )
 }}
 
--- Renamed from agg_trend_norm (moved from mart). Norm cube: member-level dimensions with enrollment metrics for normalization
+-- Renamed from agg_trend_norm (moved from mart). Norm cube: member profile x year with enrollment metrics for normalization
 -- Used to calculate PMPM and other normalized rates for 2024 vs 2025 comparison
 
 with members as (
     select * from {{ ref('dim_member') }}
 ),
 
+member_eligibility as (
+    select member_id, coverage_year, sum(member_months) as eligible_months
+    from {{ ref('fct_member_eligibility') }}
+    group by member_id, coverage_year
+),
+
 member_data as (
     select
-        year,
-        hios_id,
-        state,
-        plan_network_access_type,
-        plan_metal,
-        age_group,
-        gender,
-        region,
-        case
-            when substr(hios_id, 1, 5) = '29341' then 'OHB (Columbus)'
-            when substr(hios_id, 1, 5) = '45845' then 'OHC (Cleveland Clinic Product)'
-            when state = 'TX' then concat(state, '-', plan_network_access_type)
-            else state
-        end as geographic_reporting,
-        clinical_segment,
-        general_agency_name,
-        broker_name,
-        sa_contracting_entity_name,
-        enrollment_length_continuous,
-        case when enrollment_length_continuous <= 5 then 1 else 0 end as new_member_in_period,
-        case when call_count > 0 then 1 else 0 end as member_called_oscar,
-        member_used_app,
-        member_had_web_login,
-        member_visited_new_provider_ind,
-        high_cost_member,
-        mutually_exclusive_hcc_condition,
-        wisconsin_area_deprivation_index,
-        ra_mm,
-        member_id
+        members.year,
+        bridge.profile_id,
+        members.ra_mm,
+        coalesce(me.eligible_months, 0) as eligible_months,
+        members.member_id
     from members
-    where year in (2024, 2025)
+    inner join {{ ref('bridge_member_profile') }} bridge
+        on bridge.member_id = members.member_id
+    left join member_eligibility me
+        on me.member_id = members.member_id
+        and me.coverage_year = members.year
+    where members.year in (2024, 2025)
 )
 
+-- member attributes live in dim_member_profile; join on profile_id to slice by them
 select
     year,
-    hios_id,
-    state,
-    plan_network_access_type,
-    plan_metal,
-    age_group,
-    gender,
-    region,
-    geographic_reporting,
-    clinical_segment,
-    general_agency_name,
-    broker_name,
-    sa_contracting_entity_name,
-    enrollment_length_continuous,
-    new_member_in_period,
-    member_called_oscar,
-    member_used_app,
-    member_had_web_login,
-    member_visited_new_provider_ind,
-    high_cost_member,
-    mutually_exclusive_hcc_condition,
-    wisconsin_area_deprivation_index,
+    profile_id,
     sum(ra_mm) as member_months,
-    count(distinct member_id) as unique_members_enrolled
+    sum(eligible_months) as eligible_member_months,
+    count(distinct member_id) as unique_members_enrolled,
+    -- mergeable sketch: roll up to any coarser grain with hll_rollup()
+    {{ hll_sketch('member_id') }} as unique_members_hll
 from member_data
-group by 
-    year, hios_id, state, plan_network_access_type, plan_metal, age_group, gender,
-    region, geographic_reporting, clinical_segment, general_agency_name, broker_name,
-    sa_contracting_entity_name, enrollment_length_continuous, new_member_in_period,
-    member_called_oscar, member_used_app, member_had_web_login, 
-    member_visited_new_provider_ind, high_cost_member, mutually_exclusive_hcc_condition,
-    wisconsin_area_deprivation_index
+group by year, profile_id